@@ -17,8 +17,12 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 #
 
+import base64
 import math
 import os
+import shutil
+import tempfile
+import threading
 import time
 import warnings
 from contextlib import contextmanager
@@ -26,7 +30,7 @@ from datetime import timedelta
 from unittest import SkipTest
 
 from django.conf import settings
-from django.core import mail
+from django.core.mail.backends import locmem
 from django.test.utils import modify_settings, override_settings
 from django.urls import reverse
 from selenium import webdriver
@@ -53,7 +57,7 @@ from weblate.trans.tests.utils import (
     get_test_file,
 )
 from weblate.utils.db import using_postgresql
-from weblate.vcs.ssh import get_key_data
+from weblate.vcs.ssh import ensure_ssh_key, get_key_data
 from weblate.wladmin.models import ConfigurationError, SupportStatus
 
 TEST_BACKENDS = (
@@ -78,10 +82,26 @@ SOURCE_FONT = os.path.join(
 )
 
 
+class SignalledEmailBackend(locmem.EmailBackend):
+    """Local memory backend signalling delivery of each message."""
+
+    delivered = threading.Event()
+
+    def send_messages(self, email_messages):
+        result = super().send_messages(email_messages)
+        self.delivered.set()
+        return result
+
+
+@override_settings(
+    EMAIL_BACKEND="weblate.trans.tests.test_selenium.SignalledEmailBackend"
+)
 class SeleniumTests(BaseLiveServerTestCase, RegistrationTestMixin, TempDirMixin):
     driver = None
     driver_error = ""
+    home_url = ""
     image_path = None
+    profile_path = None
     site_domain = ""
 
     @classmethod
@@ -96,9 +116,25 @@ class SeleniumTests(BaseLiveServerTestCase, RegistrationTestMixin, TempDirMixin)
 
     @contextmanager
     def wait_for_page_load(self, timeout=30):
-        old_page = self.driver.find_element(By.TAG_NAME, "html")
+        # Grab the root element handle directly, bypassing the element
+        # locator machinery and its implicit wait
+        old_page = self.driver.execute_script("return document.documentElement")
         yield
         WebDriverWait(self.driver, timeout).until(staleness_of(old_page))
+        self._element_cache.clear()
+
+    def get_element(self, htmlid):
+        """Element lookup with a cache invalidated on every navigation."""
+        element = self._element_cache.get(htmlid)
+        if element is None:
+            element = self.driver.find_element(By.ID, htmlid)
+            self._element_cache[htmlid] = element
+        return element
+
+    def open_url(self, url):
+        """Navigate the browser, invalidating the element cache."""
+        self._element_cache.clear()
+        self.driver.get(url)
 
     @classmethod
     def setUpClass(cls):
@@ -116,6 +152,14 @@ class SeleniumTests(BaseLiveServerTestCase, RegistrationTestMixin, TempDirMixin)
         options.add_argument("--disable-dev-shm-usage")
         options.add_argument("--disable-gpu")
 
+        # Use separate browser profile for each pytest-xdist worker, so that
+        # parallel runs (pytest -n auto --dist=loadfile) get independent
+        # browser sessions instead of fighting over the default profile
+        worker = os.environ.get("PYTEST_XDIST_WORKER")
+        if worker:
+            cls.profile_path = tempfile.mkdtemp(prefix=f"weblate-chrome-{worker}-")
+            options.add_argument(f"--user-data-dir={cls.profile_path}")
+
         # Force Chrome in English
         options.add_argument("--lang=en")
         # Accept English as primary language, this does not seem to work
@@ -143,19 +187,32 @@ class SeleniumTests(BaseLiveServerTestCase, RegistrationTestMixin, TempDirMixin)
 
         if cls.driver is not None:
             cls.driver.implicitly_wait(5)
-            cls.actions = webdriver.ActionChains(cls.driver)
 
         super().setUpClass()
 
+        # The home URL is invariant across tests, resolve it just once
+        cls.home_url = f"{cls.live_server_url}{reverse('home')}"
+
+        # Generate SSH key once instead of doing that via the user
+        # interface in every test needing it
+        ensure_ssh_key()
+
     def setUp(self):
         if self.driver is None:
             warnings.warn(f"Selenium error: {self.driver_error}")
             raise SkipTest(f"Webdriver not available: {self.driver_error}")
         super().setUp()
-        self.driver.get("{}{}".format(self.live_server_url, reverse("home")))
+        self._element_cache = {}
+        self.open_url(self.home_url)
+        # Wait for the page chrome instead of sleeping for a fixed time,
+        # the explicit wait returns as soon as the element is in the DOM
+        WebDriverWait(self.driver, 10).until(
+            presence_of_element_located((By.ID, "projects-menu"))
+        )
         self.driver.set_window_size(1200, 1024)
         self.site_domain = settings.SITE_DOMAIN
         settings.SITE_DOMAIN = f"{self.host}:{self.server_thread.port}"
+        SignalledEmailBackend.delivered.clear()
 
     def tearDown(self):
         super().tearDown()
@@ -167,6 +224,9 @@ class SeleniumTests(BaseLiveServerTestCase, RegistrationTestMixin, TempDirMixin)
         if cls.driver is not None:
             cls.driver.quit()
             cls.driver = None
+        if cls.profile_path is not None:
+            shutil.rmtree(cls.profile_path, ignore_errors=True)
+            cls.profile_path = None
 
     def scroll_top(self):
         self.driver.execute_script("window.scrollTo(0, 0)")
@@ -174,27 +234,39 @@ class SeleniumTests(BaseLiveServerTestCase, RegistrationTestMixin, TempDirMixin)
     def screenshot(self, name: str):
         """Captures named full page screenshot."""
         self.scroll_top()
-        # Get window and document dimensions
-        scroll_height = self.driver.execute_script("return document.body.scrollHeight")
-        scroll_width = self.driver.execute_script("return document.body.scrollWidth")
-        # Resize the window
-        self.driver.set_window_size(scroll_width, scroll_height + 20)
-        time.sleep(0.2)
-        # Get screenshot
+        try:
+            # Capture the whole page in a single DevTools call, without
+            # resizing the window and waiting for the browser to repaint
+            result = self.driver.execute_cdp_cmd(
+                "Page.captureScreenshot",
+                {"captureBeyondViewport": True, "fromSurface": True, "format": "png"},
+            )
+            data = base64.b64decode(result["data"])
+        except WebDriverException:
+            # Get document dimensions in a single round trip
+            scroll_width, scroll_height = self.driver.execute_script(
+                "return [document.body.scrollWidth, document.body.scrollHeight]"
+            )
+            # Resize the window
+            self.driver.set_window_size(scroll_width, scroll_height + 20)
+            time.sleep(0.2)
+            data = self.driver.get_screenshot_as_png()
         with open(os.path.join(self.image_path, name), "wb") as handle:
-            handle.write(self.driver.get_screenshot_as_png())
+            handle.write(data)
 
     def click(self, element="", htmlid=None):
         """Wrapper to scroll into element for click."""
         if htmlid:
-            element = self.driver.find_element(By.ID, htmlid)
+            element = self.get_element(htmlid)
         if isinstance(element, str):
             element = self.driver.find_element(By.LINK_TEXT, element)
 
         try:
             element.click()
         except ElementNotVisibleException:
-            self.actions.move_to_element(element).perform()
+            # Use a fresh ActionChains as these are stateful queues and
+            # reusing one across tests could replay leftover actions
+            webdriver.ActionChains(self.driver).move_to_element(element).perform()
             element.click()
 
     def upload_file(self, element, filename):
@@ -203,9 +275,25 @@ class SeleniumTests(BaseLiveServerTestCase, RegistrationTestMixin, TempDirMixin)
             raise Exception(f"Test file not found: {filename}")
         element.send_keys(filename)
 
+    def fill_form(self, data: dict):
+        """Fill in several form fields in a single browser round trip."""
+        self.driver.execute_script(
+            """
+            for (var name in arguments[0]) {
+                var element = document.getElementById(name);
+                element.value = arguments[0][name];
+                element.dispatchEvent(new Event('input', {bubbles: true}));
+            }
+            """,
+            data,
+        )
+
     def clear_field(self, element):
-        element.send_keys(Keys.CONTROL + "a")
-        element.send_keys(Keys.DELETE)
+        self.driver.execute_script(
+            "arguments[0].value = '';"
+            "arguments[0].dispatchEvent(new Event('input', {bubbles: true}));",
+            element,
+        )
         return element
 
     def do_login(self, create=True, superuser=False):
@@ -228,10 +316,9 @@ class SeleniumTests(BaseLiveServerTestCase, RegistrationTestMixin, TempDirMixin)
             user = None
 
         # Login
-        username_input = self.driver.find_element(By.ID, "id_username")
-        username_input.send_keys("weblate@example.org")
-        password_input = self.driver.find_element(By.ID, "id_password")
-        password_input.send_keys("testpassword")
+        self.fill_form(
+            {"id_username": "weblate@example.org", "id_password": "testpassword"}
+        )
 
         with self.wait_for_page_load():
             self.click(self.driver.find_element(By.XPATH, '//input[@value="Sign in"]'))
@@ -261,7 +348,7 @@ class SeleniumTests(BaseLiveServerTestCase, RegistrationTestMixin, TempDirMixin)
         self.do_login(create=False)
 
         # We should end up on login page as user was invalid
-        self.driver.find_element(By.ID, "id_username")
+        self.get_element("id_username")
 
     def test_login(self):
         # Do proper login with new user
@@ -273,7 +360,7 @@ class SeleniumTests(BaseLiveServerTestCase, RegistrationTestMixin, TempDirMixin)
             self.click(htmlid="settings-button")
 
         # Wait for profile to load
-        self.driver.find_element(By.ID, "notifications")
+        self.get_element("notifications")
 
         # Load translation memory
         self.click(htmlid="user-dropdown")
@@ -288,7 +375,7 @@ class SeleniumTests(BaseLiveServerTestCase, RegistrationTestMixin, TempDirMixin)
             self.click(htmlid="logout-button")
 
         # We should be back on home page
-        self.driver.find_element(By.ID, "browse-projects")
+        self.get_element("browse-projects")
 
     def register_user(self):
         # registration page
@@ -296,19 +383,18 @@ class SeleniumTests(BaseLiveServerTestCase, RegistrationTestMixin, TempDirMixin)
             self.click(htmlid="register-button")
 
         # Fill in registration form
-        self.driver.find_element(By.ID, "id_email").send_keys("weblate@example.org")
-        self.driver.find_element(By.ID, "id_username").send_keys("test-example")
-        self.driver.find_element(By.ID, "id_fullname").send_keys("Test Example")
+        self.fill_form(
+            {
+                "id_email": "weblate@example.org",
+                "id_username": "test-example",
+                "id_fullname": "Test Example",
+            }
+        )
         with self.wait_for_page_load():
             self.click(self.driver.find_element(By.XPATH, '//input[@value="Register"]'))
 
         # Wait for registration email
-        loops = 0
-        while not mail.outbox:
-            time.sleep(0.2)
-            loops += 1
-            if loops > 20:
-                break
+        SignalledEmailBackend.delivered.wait(20)
 
         return self.assert_registration_mailbox()
 
@@ -327,7 +413,7 @@ class SeleniumTests(BaseLiveServerTestCase, RegistrationTestMixin, TempDirMixin)
                 warnings.warn(f"Ignoring: {error}")
 
         # Confirm account
-        self.driver.get(url)
+        self.open_url(url)
 
         # Check we got message
         self.assertIn(
@@ -336,9 +422,7 @@ class SeleniumTests(BaseLiveServerTestCase, RegistrationTestMixin, TempDirMixin)
 
         # Check we're signed in
         self.click(htmlid="user-dropdown")
-        self.assertIn(
-            "Test Example", self.driver.find_element(By.ID, "profile-name").text
-        )
+        self.assertIn("Test Example", self.get_element("profile-name").text)
 
     def test_register_nocookie(self):
         """Test registration without cookies."""
@@ -363,13 +447,11 @@ class SeleniumTests(BaseLiveServerTestCase, RegistrationTestMixin, TempDirMixin)
         with self.wait_for_page_load():
             self.click("SSH keys")
 
-        # Generate SSH key
-        if get_key_data() is None:
-            with self.wait_for_page_load():
-                self.click(htmlid="generate-ssh-button")
+        # The key itself is generated in setUpClass
+        self.assertIsNotNone(get_key_data())
 
         # Add SSH host key
-        self.driver.find_element(By.ID, "id_host").send_keys("github.com")
+        self.get_element("id_host").send_keys("github.com")
         with self.wait_for_page_load():
             self.click(htmlid="ssh-add-button")
 
@@ -474,7 +556,7 @@ class SeleniumTests(BaseLiveServerTestCase, RegistrationTestMixin, TempDirMixin)
         def capture_unit(name, tab):
             unit = Unit.objects.get(source=text, translation__language=language)
             with self.wait_for_page_load():
-                self.driver.get(f"{self.live_server_url}{unit.get_absolute_url()}")
+                self.open_url(f"{self.live_server_url}{unit.get_absolute_url()}")
             self.click(htmlid=tab)
             self.screenshot(name)
             with self.wait_for_page_load():
@@ -508,8 +590,8 @@ class SeleniumTests(BaseLiveServerTestCase, RegistrationTestMixin, TempDirMixin)
             self.click("Screenshots")
 
         # Upload screenshot
-        self.driver.find_element(By.ID, "id_name").send_keys("Automatic translation")
-        element = self.driver.find_element(By.ID, "id_image")
+        self.get_element("id_name").send_keys("Automatic translation")
+        element = self.get_element("id_image")
         self.upload_file(element, get_test_file("screenshot.png"))
         with self.wait_for_page_load():
             element.submit()
@@ -522,7 +604,7 @@ class SeleniumTests(BaseLiveServerTestCase, RegistrationTestMixin, TempDirMixin)
             self.screenshot("screenshot-ocr.png")
 
         # Add string manually
-        self.driver.find_element(By.ID, "search-input").send_keys(f"'{text}'")
+        self.get_element("search-input").send_keys(f"'{text}'")
         self.click(htmlid="screenshots-search")
         wait_search()
         self.click(self.driver.find_element(By.CLASS_NAME, "add-string"))
@@ -546,16 +628,14 @@ class SeleniumTests(BaseLiveServerTestCase, RegistrationTestMixin, TempDirMixin)
             self.click("Component lists")
         with self.wait_for_page_load():
             self.click(self.driver.find_element(By.CLASS_NAME, "addlink"))
-        element = self.driver.find_element(By.ID, "id_name")
+        element = self.get_element("id_name")
         element.send_keys("All components")
         self.click("Add another Automatic component list assignment")
         self.clear_field(
-            self.driver.find_element(By.ID, "id_autocomponentlist_set-0-project_match")
+            self.get_element("id_autocomponentlist_set-0-project_match")
         ).send_keys("^.*$")
         self.clear_field(
-            self.driver.find_element(
-                By.ID, "id_autocomponentlist_set-0-component_match"
-            )
+            self.get_element("id_autocomponentlist_set-0-component_match")
         ).send_keys("^.*$")
         self.screenshot("componentlist-add.png")
         with self.wait_for_page_load():
@@ -572,20 +652,16 @@ class SeleniumTests(BaseLiveServerTestCase, RegistrationTestMixin, TempDirMixin)
             self.click("Announcements")
         with self.wait_for_page_load():
             self.click(self.driver.find_element(By.CLASS_NAME, "addlink"))
-        Select(self.driver.find_element(By.ID, "id_project")).select_by_visible_text(
-            "WeblateOrg"
-        )
-        element = self.driver.find_element(By.ID, "id_message")
+        Select(self.get_element("id_project")).select_by_visible_text("WeblateOrg")
+        element = self.get_element("id_message")
         element.send_keys("Translations will be used only if they reach 60%.")
         self.screenshot("announcement.png")
         with self.wait_for_page_load():
             element.submit()
         with self.wait_for_page_load():
             self.click(self.driver.find_element(By.CLASS_NAME, "addlink"))
-        Select(self.driver.find_element(By.ID, "id_language")).select_by_visible_text(
-            "Czech"
-        )
-        element = self.driver.find_element(By.ID, "id_message")
+        Select(self.get_element("id_language")).select_by_visible_text("Czech")
+        element = self.get_element("id_message")
         element.send_keys("Czech translators rock!")
         with self.wait_for_page_load():
             element.submit()
@@ -619,17 +695,13 @@ class SeleniumTests(BaseLiveServerTestCase, RegistrationTestMixin, TempDirMixin)
             self.click("Projects")
         with self.wait_for_page_load():
             self.click(self.driver.find_element(By.CLASS_NAME, "addlink"))
-        self.driver.find_element(By.ID, "id_name").send_keys("WeblateOrg")
-        Select(self.driver.find_element(By.ID, "id_access_control")).select_by_value(
-            "1"
-        )
-        self.driver.find_element(By.ID, "id_web").send_keys("https://weblate.org/")
-        self.driver.find_element(By.ID, "id_instructions").send_keys(
-            "https://weblate.org/contribute/"
-        )
+        self.get_element("id_name").send_keys("WeblateOrg")
+        Select(self.get_element("id_access_control")).select_by_value("1")
+        self.get_element("id_web").send_keys("https://weblate.org/")
+        self.get_element("id_instructions").send_keys("https://weblate.org/contribute/")
         self.screenshot("add-project.png")
         with self.wait_for_page_load():
-            self.driver.find_element(By.ID, "id_name").submit()
+            self.get_element("id_name").submit()
 
         # Add bilingual component
         with self.wait_for_page_load():
@@ -639,34 +711,26 @@ class SeleniumTests(BaseLiveServerTestCase, RegistrationTestMixin, TempDirMixin)
         with self.wait_for_page_load():
             self.click(self.driver.find_element(By.CLASS_NAME, "addlink"))
 
-        self.driver.find_element(By.ID, "id_name").send_keys("Language names")
-        Select(self.driver.find_element(By.ID, "id_project")).select_by_visible_text(
-            "WeblateOrg"
-        )
-        self.driver.find_element(By.ID, "id_repo").send_keys(
-            "https://github.com/WeblateOrg/demo.git"
-        )
-        self.driver.find_element(By.ID, "id_repoweb").send_keys(
+        self.get_element("id_name").send_keys("Language names")
+        Select(self.get_element("id_project")).select_by_visible_text("WeblateOrg")
+        self.get_element("id_repo").send_keys("https://github.com/WeblateOrg/demo.git")
+        self.get_element("id_repoweb").send_keys(
             "https://github.com/WeblateOrg/demo/blob/"
             "{{branch}}/{{filename}}#L{{line}}"
         )
-        self.driver.find_element(By.ID, "id_filemask").send_keys(
+        self.get_element("id_filemask").send_keys(
             "weblate/langdata/locale/*/LC_MESSAGES/django.po"
         )
-        self.driver.find_element(By.ID, "id_new_base").send_keys(
-            "weblate/langdata/locale/django.pot"
+        self.get_element("id_new_base").send_keys("weblate/langdata/locale/django.pot")
+        Select(self.get_element("id_file_format")).select_by_value("po")
+        Select(self.get_element("id_license")).select_by_value("GPL-3.0-or-later")
+        self.clear_field(self.get_element("id_language_regex")).send_keys(
+            language_regex
         )
-        Select(self.driver.find_element(By.ID, "id_file_format")).select_by_value("po")
-        Select(self.driver.find_element(By.ID, "id_license")).select_by_value(
-            "GPL-3.0-or-later"
-        )
-        self.clear_field(
-            self.driver.find_element(By.ID, "id_language_regex")
-        ).send_keys(language_regex)
         self.screenshot("add-component.png")
         # This takes long
         with self.wait_for_page_load(timeout=1200):
-            self.driver.find_element(By.ID, "id_name").submit()
+            self.get_element("id_name").submit()
         with self.wait_for_page_load():
             self.click("Language names")
 
@@ -675,27 +739,19 @@ class SeleniumTests(BaseLiveServerTestCase, RegistrationTestMixin, TempDirMixin)
             self.click("Components")
         with self.wait_for_page_load():
             self.click(self.driver.find_element(By.CLASS_NAME, "addlink"))
-        self.driver.find_element(By.ID, "id_name").send_keys("Android")
-        Select(self.driver.find_element(By.ID, "id_project")).select_by_visible_text(
-            "WeblateOrg"
-        )
-        self.driver.find_element(By.ID, "id_repo").send_keys(
-            "weblate://weblateorg/language-names"
-        )
-        self.driver.find_element(By.ID, "id_filemask").send_keys(
+        self.get_element("id_name").send_keys("Android")
+        Select(self.get_element("id_project")).select_by_visible_text("WeblateOrg")
+        self.get_element("id_repo").send_keys("weblate://weblateorg/language-names")
+        self.get_element("id_filemask").send_keys(
             "app/src/main/res/values-*/strings.xml"
         )
-        self.driver.find_element(By.ID, "id_template").send_keys(
-            "app/src/main/res/values/strings.xml"
-        )
-        Select(self.driver.find_element(By.ID, "id_file_format")).select_by_value(
-            "aresource"
-        )
-        Select(self.driver.find_element(By.ID, "id_license")).select_by_value("MIT")
+        self.get_element("id_template").send_keys("app/src/main/res/values/strings.xml")
+        Select(self.get_element("id_file_format")).select_by_value("aresource")
+        Select(self.get_element("id_license")).select_by_value("MIT")
         self.screenshot("add-component-mono.png")
         # This takes long
         with self.wait_for_page_load(timeout=1200):
-            self.driver.find_element(By.ID, "id_name").submit()
+            self.get_element("id_name").submit()
         with self.wait_for_page_load():
             self.click("Android")
 
@@ -713,7 +769,7 @@ class SeleniumTests(BaseLiveServerTestCase, RegistrationTestMixin, TempDirMixin)
         self.click("Manage")
         with self.wait_for_page_load():
             self.click("Users")
-        element = self.driver.find_element(By.ID, "id_user")
+        element = self.get_element("id_user")
         element.send_keys("testuser")
         with self.wait_for_page_load():
             element.submit()
@@ -776,25 +832,25 @@ class SeleniumTests(BaseLiveServerTestCase, RegistrationTestMixin, TempDirMixin)
                     By.XPATH, '//button[@data-addon="weblate.discovery.discovery"]'
                 )
             )
-        element = self.driver.find_element(By.ID, "id_match")
+        element = self.get_element("id_match")
         element.send_keys(
             "weblate/locale/(?P<language>[^/]*)/LC_MESSAGES/"
             "(?P<component>[^/]*)\\.po"
         )
-        self.clear_field(
-            self.driver.find_element(By.ID, "id_language_regex")
-        ).send_keys(language_regex)
-        self.driver.find_element(By.ID, "id_new_base_template").send_keys(
+        self.clear_field(self.get_element("id_language_regex")).send_keys(
+            language_regex
+        )
+        self.get_element("id_new_base_template").send_keys(
             "weblate/locale/{{ component }}.pot"
         )
-        self.clear_field(self.driver.find_element(By.ID, "id_name_template")).send_keys(
+        self.clear_field(self.get_element("id_name_template")).send_keys(
             "{{ component|title }}"
         )
-        Select(self.driver.find_element(By.ID, "id_file_format")).select_by_value("po")
+        Select(self.get_element("id_file_format")).select_by_value("po")
         with self.wait_for_page_load():
             element.submit()
         self.screenshot("addon-discovery.png")
-        element = self.driver.find_element(By.ID, "id_confirm")
+        element = self.get_element("id_confirm")
         self.click(element)
         # This takes long
         with self.wait_for_page_load(timeout=1200):
@@ -812,7 +868,7 @@ class SeleniumTests(BaseLiveServerTestCase, RegistrationTestMixin, TempDirMixin)
         self.click("Manage")
         with self.wait_for_page_load():
             self.click("Settings")
-        element = self.driver.find_element(By.ID, "id_agreement")
+        element = self.get_element("id_agreement")
         element.send_keys("This is an agreement.")
         with self.wait_for_page_load():
             element.submit()
@@ -821,7 +877,7 @@ class SeleniumTests(BaseLiveServerTestCase, RegistrationTestMixin, TempDirMixin)
         self.screenshot("contributor-agreement.png")
         with self.wait_for_page_load():
             self.click("View contributor agreement")
-        element = self.driver.find_element(By.ID, "id_confirm")
+        element = self.get_element("id_confirm")
         self.click(element)
         with self.wait_for_page_load():
             element.submit()
@@ -845,7 +901,7 @@ class SeleniumTests(BaseLiveServerTestCase, RegistrationTestMixin, TempDirMixin)
         self.click("Tools")
         self.screenshot("automatic-translation.png")
         self.click("Search")
-        element = self.driver.find_element(By.ID, "id_q")
+        element = self.get_element("id_q")
         element.send_keys("'%(count)s word'")
         with self.wait_for_page_load():
             element.submit()
@@ -855,7 +911,7 @@ class SeleniumTests(BaseLiveServerTestCase, RegistrationTestMixin, TempDirMixin)
         self.screenshot("plurals.png")
 
         # Test search dropdown
-        dropdown = self.driver.find_element(By.ID, "query-dropdown")
+        dropdown = self.get_element("query-dropdown")
         dropdown.click()
         time.sleep(0.2)
         self.screenshot("query-dropdown.png")
@@ -863,10 +919,10 @@ class SeleniumTests(BaseLiveServerTestCase, RegistrationTestMixin, TempDirMixin)
             self.click(
                 self.driver.find_element(By.PARTIAL_LINK_TEXT, "Untranslated strings")
             )
-        self.driver.find_element(By.ID, "id_34a4642999e44a2b_0")
+        self.get_element("id_34a4642999e44a2b_0")
 
         # Test sort dropdown
-        sort = self.driver.find_element(By.ID, "query-sort-dropdown")
+        sort = self.get_element("query-sort-dropdown")
         sort.click()
         time.sleep(0.2)
         self.screenshot("query-sort.png")
@@ -874,15 +930,15 @@ class SeleniumTests(BaseLiveServerTestCase, RegistrationTestMixin, TempDirMixin)
             self.click("Position")
 
         # Return to original unit
-        element = self.driver.find_element(By.ID, "id_q")
+        element = self.get_element("id_q")
         self.clear_field(element)
         element.send_keys("'%(count)s word'")
         with self.wait_for_page_load():
             element.submit()
 
         # Trigger check
-        self.clear_field(self.driver.find_element(By.ID, "id_a2a808c8ccbece08_0"))
-        element = self.driver.find_element(By.ID, "id_a2a808c8ccbece08_1")
+        self.clear_field(self.get_element("id_a2a808c8ccbece08_0"))
+        element = self.get_element("id_a2a808c8ccbece08_1")
         self.clear_field(element)
         element.send_keys("několik slov")
         with self.wait_for_page_load():
@@ -941,14 +997,12 @@ class SeleniumTests(BaseLiveServerTestCase, RegistrationTestMixin, TempDirMixin)
             self.click(self.driver.find_element(By.CLASS_NAME, "billing-add-project"))
 
         # Add project
-        self.driver.find_element(By.ID, "id_name").send_keys("WeblateOrg")
-        self.driver.find_element(By.ID, "id_web").send_keys("https://weblate.org/")
-        self.driver.find_element(By.ID, "id_instructions").send_keys(
-            "https://weblate.org/contribute/"
-        )
+        self.get_element("id_name").send_keys("WeblateOrg")
+        self.get_element("id_web").send_keys("https://weblate.org/")
+        self.get_element("id_instructions").send_keys("https://weblate.org/contribute/")
         self.screenshot("user-add-project.png")
         with self.wait_for_page_load():
-            self.driver.find_element(By.ID, "id_name").submit()
+            self.get_element("id_name").submit()
         self.screenshot("user-add-project-done.png")
 
         # Click on add component
@@ -956,36 +1010,30 @@ class SeleniumTests(BaseLiveServerTestCase, RegistrationTestMixin, TempDirMixin)
             self.click(self.driver.find_element(By.CLASS_NAME, "project-add-component"))
 
         # Add component
-        self.driver.find_element(By.ID, "id_name").send_keys("Language names")
-        self.driver.find_element(By.ID, "id_repo").send_keys(
-            "https://github.com/WeblateOrg/demo.git"
-        )
+        self.get_element("id_name").send_keys("Language names")
+        self.get_element("id_repo").send_keys("https://github.com/WeblateOrg/demo.git")
         self.screenshot("user-add-component-init.png")
         with self.wait_for_page_load(timeout=1200):
-            self.driver.find_element(By.ID, "id_name").submit()
+            self.get_element("id_name").submit()
 
         self.screenshot("user-add-component-discovery.png")
-        self.driver.find_element(By.ID, "id_discovery_1").click()
+        self.get_element("id_discovery_1").click()
         with self.wait_for_page_load(timeout=1200):
-            self.driver.find_element(By.ID, "id_name").submit()
+            self.get_element("id_name").submit()
 
-        self.driver.find_element(By.ID, "id_repoweb").send_keys(
+        self.get_element("id_repoweb").send_keys(
             "https://github.com/WeblateOrg/demo/blob/"
             "{{branch}}/{{filename}}#L{{line}}"
         )
-        self.driver.find_element(By.ID, "id_filemask").send_keys(
+        self.get_element("id_filemask").send_keys(
             "weblate/langdata/locale/*/LC_MESSAGES/django.po"
         )
-        self.driver.find_element(By.ID, "id_new_base").send_keys(
-            "weblate/langdata/locale/django.pot"
-        )
-        Select(self.driver.find_element(By.ID, "id_file_format")).select_by_value("po")
-        Select(self.driver.find_element(By.ID, "id_license")).select_by_value(
-            "GPL-3.0-or-later"
+        self.get_element("id_new_base").send_keys("weblate/langdata/locale/django.pot")
+        Select(self.get_element("id_file_format")).select_by_value("po")
+        Select(self.get_element("id_license")).select_by_value("GPL-3.0-or-later")
+        self.clear_field(self.get_element("id_language_regex")).send_keys(
+            "^(cs|he|hu)$"
         )
-        self.clear_field(
-            self.driver.find_element(By.ID, "id_language_regex")
-        ).send_keys("^(cs|he|hu)$")
         self.screenshot("user-add-component.png")
 
     def test_alerts(self):
@@ -1030,7 +1078,7 @@ class SeleniumTests(BaseLiveServerTestCase, RegistrationTestMixin, TempDirMixin)
         self.click(htmlid="tab_fonts")
 
         # Upload font
-        element = self.driver.find_element(By.ID, "id_font")
+        element = self.get_element("id_font")
         self.upload_file(element, FONT)
         with self.wait_for_page_load():
             self.click(htmlid="upload_font_submit")
@@ -1041,7 +1089,7 @@ class SeleniumTests(BaseLiveServerTestCase, RegistrationTestMixin, TempDirMixin)
             self.click("Fonts")
 
         # Upload second font
-        element = self.driver.find_element(By.ID, "id_font")
+        element = self.get_element("id_font")
         self.upload_file(element, SOURCE_FONT)
         with self.wait_for_page_load():
             self.click(htmlid="upload_font_submit")
@@ -1054,25 +1102,25 @@ class SeleniumTests(BaseLiveServerTestCase, RegistrationTestMixin, TempDirMixin)
         self.click(htmlid="tab_groups")
 
         # Create group
-        Select(self.driver.find_element(By.ID, "id_group_font")).select_by_visible_text(
+        Select(self.get_element("id_group_font")).select_by_visible_text(
             "Source Sans 3 Bold"
         )
-        element = self.driver.find_element(By.ID, "id_group_name")
+        element = self.get_element("id_group_name")
         element.send_keys("default-font")
         with self.wait_for_page_load():
             element.submit()
 
-        Select(self.driver.find_element(By.ID, "id_font")).select_by_visible_text(
+        Select(self.get_element("id_font")).select_by_visible_text(
             "Droid Sans Fallback Regular"
         )
-        element = self.driver.find_element(By.ID, "id_language")
+        element = self.get_element("id_language")
         Select(element).select_by_visible_text("Japanese")
         with self.wait_for_page_load():
             element.submit()
-        Select(self.driver.find_element(By.ID, "id_font")).select_by_visible_text(
+        Select(self.get_element("id_font")).select_by_visible_text(
             "Droid Sans Fallback Regular"
         )
-        element = self.driver.find_element(By.ID, "id_language")
+        element = self.get_element("id_language")
         Select(element).select_by_visible_text("Korean")
         with self.wait_for_page_load():
             element.submit()
@@ -1091,7 +1139,7 @@ class SeleniumTests(BaseLiveServerTestCase, RegistrationTestMixin, TempDirMixin)
             self.screenshot("support.png")
             with self.wait_for_page_load():
                 self.click("Backups")
-            element = self.driver.find_element(By.ID, "id_repository")
+            element = self.get_element("id_repository")
             element.send_keys(self.tempdir)
             with self.wait_for_page_load():
                 element.submit()
@@ -1128,12 +1176,12 @@ class SeleniumTests(BaseLiveServerTestCase, RegistrationTestMixin, TempDirMixin)
         self.click("Manage")
         with self.wait_for_page_load():
             self.click("Labels")
-        element = self.driver.find_element(By.ID, "id_name")
+        element = self.get_element("id_name")
         element.send_keys("Current sprint")
         self.click(self.driver.find_element(By.CLASS_NAME, "label-green"))
         with self.wait_for_page_load():
             element.submit()
-        element = self.driver.find_element(By.ID, "id_name")
+        element = self.get_element("id_name")
         element.send_keys("Next sprint")
         self.click(self.driver.find_element(By.CLASS_NAME, "label-aqua"))
         with self.wait_for_page_load():
@@ -1151,7 +1199,7 @@ class SeleniumTests(BaseLiveServerTestCase, RegistrationTestMixin, TempDirMixin)
         with self.wait_for_page_load():
             self.click("Settings")
         self.click("Translation")
-        element = self.driver.find_element(By.ID, "id_variant_regex")
+        element = self.get_element("id_variant_regex")
         element.send_keys("_(short|min)$")
         self.screenshot("variants-settings.png")
         with self.wait_for_page_load():
@@ -1166,7 +1214,7 @@ class SeleniumTests(BaseLiveServerTestCase, RegistrationTestMixin, TempDirMixin)
 
         # Find string with variants
         self.click("Search")
-        element = self.driver.find_element(By.ID, "id_q")
+        element = self.get_element("id_q")
         element.send_keys("Monday")
         with self.wait_for_page_load():
             element.submit()
@@ -1182,7 +1230,7 @@ class SeleniumTests(BaseLiveServerTestCase, RegistrationTestMixin, TempDirMixin)
         self.screenshot("source-review-edit.png")
 
         # Close modal dialog
-        self.driver.find_element(By.ID, "id_extra_flags").send_keys(Keys.ESCAPE)
+        self.get_element("id_extra_flags").send_keys(Keys.ESCAPE)
         time.sleep(0.2)
 
     def test_glossary(self):
@@ -1191,7 +1239,7 @@ class SeleniumTests(BaseLiveServerTestCase, RegistrationTestMixin, TempDirMixin)
         language = Language.objects.get(code="cs")
         glossary = self.create_glossary(project, language)
 
-        self.driver.get(f"{self.live_server_url}{glossary.get_absolute_url()}")
+        self.open_url(f"{self.live_server_url}{glossary.get_absolute_url()}")
         self.screenshot("glossary-component.png")
 
         with self.wait_for_page_load():